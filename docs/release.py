@@ -1,5 +1,5 @@
 import argparse
-import os
+import ast
 import shutil
 import subprocess
 import sys
@@ -9,9 +9,66 @@ from pathlib import Path
 from rich.console import Console
 from rich.markup import escape
 
+
+class StreamTarFile(tarfile.TarFile):
+    """The tar file that does not keep added members in memory."""
+
+    def addfile(self, tarinfo, fileobj=None):
+        super().addfile(tarinfo, fileobj)
+        self.members.clear()
+
+
+def exclude_artifacts(tarinfo):
+    """Skip the build info before its header is written."""
+
+    # ``_sources`` is not built at all, since ``html_copy_source`` is disabled.
+    if tarinfo.name.rpartition("/")[2] == ".buildinfo":
+        return None
+    return tarinfo
+
+
+def make_tarball(dist_path, src_path, arcname):
+    """Make a ``.tar.xz`` tarball, using an external ``xz`` process if available."""
+
+    try:
+        # The archive is written once and sequentially, so use the stream mode.
+        with open(dist_path, "wb", buffering=1 << 20) as f:
+            if (xz := shutil.which("xz")) is None:
+                with StreamTarFile.open(fileobj=f, mode="w|xz") as tar:
+                    tar.add(src_path, arcname, filter=exclude_artifacts)
+                return
+
+            # Keep the default preset. ``-T0`` only uses several threads for
+            # archives larger than one block (24 MiB at the default preset).
+            proc = subprocess.Popen([xz, "-T0", "-c"], stdin=subprocess.PIPE, stdout=f)
+            try:
+                with proc.stdin, StreamTarFile.open(fileobj=proc.stdin, mode="w|") as tar:
+                    tar.add(src_path, arcname, filter=exclude_artifacts)
+            finally:
+                # Closing stdin above lets xz exit, so it is always reaped.
+                returncode = proc.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, proc.args)
+    except BaseException:
+        # Do not leave a truncated tarball behind.
+        dist_path.unlink(missing_ok=True)
+        raise
+
+
+def read_metadata(path):
+    """Read the literal dunder metadata from a module without importing it."""
+
+    metadata = {}
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name.startswith("__") and name.endswith("__"):
+                metadata[name] = ast.literal_eval(node.value)
+    return metadata
+
+
 src_dir = Path(__file__).resolve().parents[1].joinpath("src")
-sys.path.insert(0, os.fsdecode(src_dir))
-import clixx as pkg
+pkg_metadata = read_metadata(src_dir / "clixx" / "__init__.py")
 
 parser = argparse.ArgumentParser()
 parser.add_argument("--clean", action="store_true", help="clean the build directory")
@@ -35,9 +92,8 @@ subprocess.run([sys.executable, "-m", "sphinx.cmd.build", "-b", "html", "-d", do
 if args.dist:
     dist_dir = docs_dir / "dist"
     dist_dir.mkdir(parents=True, exist_ok=True)
-    dist_name = f"{pkg.__title__}-{pkg.__version__}-docs"
+    dist_name = f"{pkg_metadata['__title__']}-{pkg_metadata['__version__']}-docs"
     dist_path = dist_dir / f"{dist_name}.tar.xz"
 
-    with tarfile.open(dist_path, "w:xz") as tar:
-        tar.add(html_dir, dist_name)
+    make_tarball(dist_path, html_dir, dist_name)
     console.print(f"[b green]Build a distribution [u]{escape(str(dist_path))}[/u][/b green]")
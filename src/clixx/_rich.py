@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 from rich.console import Console
 from rich.style import Style
@@ -10,111 +11,126 @@ from rich.text import Text
 from .commands import Command, SuperCommand, _Command
 
 if TYPE_CHECKING:
+    from .arguments import Option
     from .exceptions import CLIXXException
 
+_ERROR_STYLE = Style(color="red", bold=True)
 
-def _get_console_params(config: dict[str, Any]) -> dict[str, Any]:
-    params = {}
-    for param in ["markup", "emoji", "highlight", "highlighter"]:
-        if param in config:
-            params[param] = config.pop(param)
-    return params
+_CONSOLE_PARAMS = ("markup", "emoji", "highlight", "highlighter")
+
+
+_TABLE_PARAMS: dict[str, Any] = {"box": None, "padding": (0, 0, 0, 2), "show_header": False, "show_edge": False}
+
+
+def _get_console_params(config: dict[str, Any]) -> Mapping[str, Any]:
+    # Do not pop from ``config``, which is shared by every printer of a command.
+    params = {param: config[param] for param in _CONSOLE_PARAMS if param in config}
+    # Return a read-only view so that printing can not change the params.
+    return MappingProxyType(params)
+
+
+def _print(console: Console, renderable: str | Text = "", *, soft_wrap: bool = False, **kwargs: Any) -> None:
+    if not soft_wrap or console.is_terminal or console.is_jupyter:
+        console.print(renderable, soft_wrap=soft_wrap, **kwargs)
+        return
+
+    # Soft wrapped output is never wrapped to the console width, and styles
+    # are dropped when output is not a terminal, so skip Rich's render
+    # pipeline and write the plain text directly. Each console is private to
+    # one print, so no capture or concurrent writer can be bypassed.
+    text = renderable if isinstance(renderable, Text) else console.render_str(renderable)
+    console.file.write(text.plain + "\n")
 
 
 def _print_error(console: Console, exc: CLIXXException) -> None:
     # SECURITY: ``exc.message`` usually contains user input.
     # To avoid injection, construct :class:`rich.text.Text`.
-    style = Style(color="red", bold=True)
-    text = Text("Error: " + exc.message, style=style)
-    console.print(text, soft_wrap=True)
+    text = Text("Error: " + exc.message, style=_ERROR_STYLE)
+    _print(console, text, soft_wrap=True)
+
+
+def _option_row(option: Option) -> tuple[str, str]:
+    opts = option.display_opts
+    if metavar := option.resolve_metavar():
+        opts += " " + metavar
+    return opts, option.help
+
+
+def _print_table(console: Console, title: str, header: str, rows: list[tuple[str, str]]) -> None:
+    _print(console, f"\n{title}:")
+    table = Table(header, "Descriptions", **_TABLE_PARAMS)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
 
 
 class RichPrinter:
     def __init__(self, config: dict[str, Any]) -> None:
         self.config = config
         self.console_params = _get_console_params(config)
+        self.try_help_option = config.get("try_help_option", "--help")
 
-    def _print_usage(self, console: Console, cmd: _Command) -> None:
-        text = Text("Usage: " + cmd.get_cmd_path())
+    def _build_usage(self, cmd: _Command) -> str:
+        parts: list[str] = []
 
         if isinstance(cmd, (Command, SuperCommand)):
             if cmd.option_groups:
-                text.append(" [OPTIONS]...")
+                parts.append("[OPTIONS]...")
 
         if isinstance(cmd, Command):
-            for argument_group in cmd.argument_groups:
-                for argument in argument_group:
-                    if metavar := argument.resolve_metavar():
-                        if not argument.required:
-                            metavar = "[" + metavar + "]"
-                        if argument.nargs == -1:
-                            metavar += "..."
-                        text.append(" " + metavar)
+            parts.extend(cmd.usage_metavars)
         elif isinstance(cmd, SuperCommand):
-            text.append(" COMMAND")
-            text.append(" [ARGS]...")
+            parts.append("COMMAND")
+            parts.append("[ARGS]...")
+
+        return " " + " ".join(parts) if parts else ""
 
-        console.print(text, soft_wrap=True)
+    def _print_usage(self, console: Console, cmd: _Command, cmd_path: str) -> None:
+        text = Text("Usage: " + cmd_path + self._build_usage(cmd))
+        _print(console, text, soft_wrap=True)
 
-    def _print_try_help(self, console: Console, cmd: _Command) -> None:
-        option = self.config.get("try_help_option", "--help")
-        text = Text("Try " + repr(cmd.get_cmd_path() + " " + option) + " for help.")
-        console.print(text, soft_wrap=True)
+    def _print_try_help(self, console: Console, cmd_path: str) -> None:
+        text = Text("Try " + repr(cmd_path + " " + self.try_help_option) + " for help.")
+        _print(console, text, soft_wrap=True)
 
     def print_error(self, cmd: _Command, exc: CLIXXException) -> None:
         console = Console(stderr=True, **self.console_params)
-        self._print_usage(console, cmd)
-        self._print_try_help(console, cmd)
-        console.print()
+        cmd_path = cmd.get_cmd_path()
+        self._print_usage(console, cmd, cmd_path)
+        self._print_try_help(console, cmd_path)
+        _print(console)
         _print_error(console, exc)
 
     def print_help(self, cmd: _Command) -> None:
         console = Console(**self.console_params)
-        self._print_usage(console, cmd)
+        self._print_usage(console, cmd, cmd.get_cmd_path())
 
         if isinstance(cmd, Command):
             for argument_group in cmd.argument_groups:
                 if argument_group.hidden:
                     continue
-                console.print(f"\n{argument_group.title}:")
-                table = Table(box=None, padding=(0, 0, 0, 2), show_header=False, show_edge=False)
-                table.add_column("Arguments")
-                table.add_column("Descriptions")
-                for argument in argument_group:
-                    if argument.hidden:
-                        continue
-                    table.add_row(argument.argument, argument.help)
-                console.print(table)
+                rows = [(argument.argument, argument.help) for argument in argument_group if not argument.hidden]
+                _print_table(console, argument_group.title, "Arguments", rows)
         elif isinstance(cmd, SuperCommand):
             for command_group in cmd.iter_command_group():
                 if command_group.hidden:
                     continue
-                console.print(f"\n{command_group.title}:")
+                _print(console, f"\n{command_group.title}:")
 
                 # TODO
                 for cmd_name in command_group:
-                    console.print(f"  {cmd_name}")
+                    _print(console, f"  {cmd_name}")
 
         if isinstance(cmd, (Command, SuperCommand)):
             for option_group in cmd.option_groups:
                 if option_group.hidden:
                     continue
-                console.print(f"\n{option_group.title}:")
-                table = Table(box=None, padding=(0, 0, 0, 2), show_header=False, show_edge=False)
-                table.add_column("Options")
-                table.add_column("Descriptions")
-                for option in option_group:
-                    if option.hidden:
-                        continue
-                    opts = ", ".join(option.short_options + option.long_options)
-                    if metavar := option.resolve_metavar():
-                        opts += " " + metavar
-                    table.add_row(opts, option.help)
-                console.print(table)
+                rows = [_option_row(option) for option in option_group if not option.hidden]
+                _print_table(console, option_group.title, "Options", rows)
 
     def print_version(self, cmd: _Command) -> None:
         console = Console(**self.console_params)
         name = cmd.get_name()
         version = cmd.get_version()
         version_info = f"{name} {version}"
-        console.print(version_info, highlight=False)
+        _print(console, version_info, highlight=False)
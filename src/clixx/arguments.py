@@ -1,28 +1,67 @@
 from __future__ import annotations
 
-from keyword import iskeyword
-from typing import Any, Literal, Sequence, cast
+import re
+import sys
+from functools import lru_cache
+from keyword import kwlist
+from typing import Any, ClassVar, Literal, NoReturn, Sequence
 
 from .constants import LONG_PREFIX, LONG_PREFIX_LEN, RESERVED_CHARACTERS, SEPARATOR, SHORT_PREFIX, SHORT_PREFIX_LEN
 from .exceptions import DefinitionError, HelpSignal, TypeConversionError, VersionSignal
-from .types import Int, Str, Type, resolve_type
+from .types import Int, Str, Type, _is_native, _is_pure, resolve_type
 
+_KEYWORDS = frozenset(kwlist)
 
+# Most destinations are ASCII, which does not need the Unicode tables of ``str.isidentifier``.
+_match_ascii_identifier = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z").match
+
+_RESERVED_CLASS = re.escape("".join(sorted(RESERVED_CHARACTERS)))
+
+# Scan declarations for reserved characters in one pass.
+_search_reserved = re.compile(f"[{_RESERVED_CLASS}]").search
+
+# The valid long option has at least two characters after the prefix, and the
+# valid short option has exactly one, none of them reserved.
+_match_long_option = re.compile(f"{re.escape(LONG_PREFIX)}[^{_RESERVED_CLASS}]{{2,}}").fullmatch
+_match_short_option = re.compile(f"{re.escape(SHORT_PREFIX)}[^{re.escape(SHORT_PREFIX)}{_RESERVED_CLASS}]").fullmatch
+
+# The stateless type converters shared by arguments and options defaulting to them.
+_DEFAULT_TYPE = Type()
+_DEFAULT_STR = Str()
+_DEFAULT_INT = Int()
+
+# The sentinel for a default result that can not be computed in advance.
+_UNSET: Any = object()
+
+
+def _safe_convert(type: Type, value: Any) -> Any:
+    # The value already of the target type converts to itself.
+    if _is_native(type, value):
+        return value
+    return type.safe_convert(value)
+
+
+@lru_cache(maxsize=1024)
 def _check_dest(dest: str) -> str:
-    dest = dest.replace("-", "_")
-    if not dest.isidentifier():
+    if "-" in dest:
+        dest = dest.replace("-", "_")
+    if _match_ascii_identifier(dest) is None and not dest.isidentifier():
         raise DefinitionError(f"{dest!r} is not a valid identifier.")
-    if iskeyword(dest):
+    if dest in _KEYWORDS:
         raise DefinitionError(f"{dest!r} is a keyword.")
-    return dest
+    # The destination is used as a key of the args dict.
+    return sys.intern(dest)
 
 
+@lru_cache(maxsize=1024)
 def _norm_metavar(metavar: str) -> str:
     return metavar.replace("-", "_").upper()
 
 
 def _remove_prefix(decl: str) -> str:
-    if decl.startswith(LONG_PREFIX):
+    # The declaration is already parsed, so the second character tells the
+    # long prefix from a short option.
+    if decl[1] == SHORT_PREFIX:
         return decl[LONG_PREFIX_LEN:]
     else:
         return decl[SHORT_PREFIX_LEN:]
@@ -32,42 +71,57 @@ def _parse_decl(decl: str) -> str:
     if not decl:
         raise DefinitionError("Argument must be non-empty.")
 
-    for rc in RESERVED_CHARACTERS:
-        if rc in decl:
-            raise DefinitionError(f"Argument {decl!r} contains reserved character {rc!r}.")
+    if (m := _search_reserved(decl)) is not None:
+        raise DefinitionError(f"Argument {decl!r} contains reserved character {m.group()!r}.")
     return decl
 
 
+def _raise_invalid_decl(decl: str) -> NoReturn:
+    # The long prefix is the short prefix doubled, so classify the
+    # declaration by its first two characters.
+    if not (decl_len := len(decl)):
+        raise DefinitionError("Option must be non-empty.")
+    if decl[0] != SHORT_PREFIX:
+        raise DefinitionError(f"Option must start with {LONG_PREFIX!r} or {SHORT_PREFIX!r}, got {decl!r}.")
+    if decl_len > 1 and decl[1] == SHORT_PREFIX:
+        if decl_len == LONG_PREFIX_LEN:
+            raise DefinitionError(f"{decl!r} is not a valid long option.")
+        if decl_len < LONG_PREFIX_LEN + 2:
+            raise DefinitionError(f"Long option {decl!r} is too short.")
+    else:
+        if decl_len == SHORT_PREFIX_LEN:
+            raise DefinitionError(f"{decl!r} is not a valid short option.")
+        if decl_len > SHORT_PREFIX_LEN + 1:
+            raise DefinitionError(f"Short option {decl!r} is too long.")
+    # The shape is valid, so the declaration must contain reserved characters.
+    rcs_str = ", ".join(map(repr, sorted(RESERVED_CHARACTERS.intersection(decl))))
+    raise DefinitionError(f"Option {decl!r} contains reserved character {rcs_str}.")
+
+
 def _parse_decls(decls: Sequence[str]) -> tuple[list[str], list[str]]:
+    long_options, short_options = _parse_decls_cached(tuple(decls))
+    # Return copies so that callers can not corrupt the cache.
+    return list(long_options), list(short_options)
+
+
+@lru_cache(maxsize=1024)
+def _parse_decls_cached(decls: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...]]:
     if not decls:
         raise DefinitionError("No option defined.")
 
     long_options: list[str] = []
     short_options: list[str] = []
     for decl in decls:
-        if decl.startswith(LONG_PREFIX):
-            decl_len = len(decl)
-            if decl_len == LONG_PREFIX_LEN:
-                raise DefinitionError(f"{decl!r} is not a valid long option.")
-            if decl_len <= LONG_PREFIX_LEN + 1:
-                raise DefinitionError(f"Long option {decl!r} is too short.")
+        # Valid declarations are fully matched in one pass, and only invalid
+        # ones are inspected again to tell what is wrong.
+        if _match_long_option(decl) is not None:
             long_options.append(decl)
-        elif decl.startswith(SHORT_PREFIX):
-            decl_len = len(decl)
-            if decl_len == SHORT_PREFIX_LEN:
-                raise DefinitionError(f"{decl!r} is not a valid short option.")
-            if decl_len >= SHORT_PREFIX_LEN + 2:
-                raise DefinitionError(f"Short option {decl!r} is too long.")
+        elif _match_short_option(decl) is not None:
             short_options.append(decl)
-        elif not decl:
-            raise DefinitionError("Option must be non-empty.")
         else:
-            raise DefinitionError(f"Option must start with {LONG_PREFIX!r} or {SHORT_PREFIX!r}, got {decl!r}.")
-
-        if rcs := RESERVED_CHARACTERS.intersection(decl):
-            rcs_str = ", ".join(map(repr, sorted(rcs)))
-            raise DefinitionError(f"Option {decl!r} contains reserved character {rcs_str}.")
-    return long_options, short_options
+            _raise_invalid_decl(decl)
+    # The options are used as keys of the option map.
+    return tuple(map(sys.intern, long_options)), tuple(map(sys.intern, short_options))
 
 
 class Argument:
@@ -98,6 +152,21 @@ class Argument:
             The help information.
     """
 
+    __slots__ = (
+        "dest",
+        "argument",
+        "_nargs",
+        "required",
+        "_type",
+        "_convert_str",
+        "_default",
+        "_default_result",
+        "hidden",
+        "show_default",
+        "metavar",
+        "help",
+    )
+
     def __init__(
         self,
         decl: str,
@@ -115,7 +184,7 @@ class Argument:
         self.dest, self.argument = self._parse(decl, dest=dest)
         self.nargs = nargs
         self.required = required
-        self.type = resolve_type(type or Str())
+        self.type = resolve_type(type) if type is not None else _DEFAULT_STR
         self.default = default
         self.hidden = hidden
         self.show_default = show_default
@@ -135,15 +204,18 @@ class Argument:
     def store(self, args: dict[str, Any], value: str) -> None:
         """Store value to destination."""
 
-        if not self.dest:
+        if not (dest := self.dest):
             return
 
-        result = self.type.convert_str(value)
+        result = self._convert_str(value)
         if self.nargs == 1:
-            args[self.dest] = result
+            args[dest] = result
         else:
-            # Variadic arguments are stored as list.
-            cast(list, args.setdefault(self.dest, [])).append(result)
+            # Variadic arguments are stored as list. Avoid allocating a
+            # throwaway list as ``setdefault`` does on every value.
+            if (values := args.get(dest)) is None:
+                args[dest] = values = []
+            values.append(result)
 
     def store_default(self, args: dict[str, Any]) -> None:
         """Store default value to destination."""
@@ -152,7 +224,8 @@ class Argument:
             return
 
         if self.nargs == 1:
-            result = self.type(self.default) if self.default is not None else None
+            if (result := self._default_result) is _UNSET:
+                result = self.type(self.default) if self.default is not None else None
         else:
             # Variadic arguments default to empty list.
             result = []
@@ -177,9 +250,19 @@ class Argument:
 
     @nargs.setter
     def nargs(self, value: int) -> None:
-        if not (value == 1 or value == -1):
-            raise DefinitionError(f"Require nargs == 1 or nargs == -1, got {value!r}.")
-        self._nargs = value
+        self._nargs = self._check_nargs(value)
+
+    @property
+    def type(self) -> Type:
+        return self._type
+
+    @type.setter
+    def type(self, value: Type) -> None:
+        self._type = value
+        # Bind the converter once for the parser to call on every value.
+        self._convert_str = value.convert_str
+        # The default is converted again on demand until it is reassigned.
+        self._default_result = _UNSET
 
     @property
     def default(self) -> Any:
@@ -187,16 +270,30 @@ class Argument:
 
     @default.setter
     def default(self, value: Any) -> None:
-        if value is not None:
-            if self.nargs == 1:
-                value = self._verify(value)
-            else:
-                raise DefinitionError("For nargs == -1, the default value must be None.")
-        self._default = value
-
-    def _verify(self, value: Any) -> Any:
+        self._default = self._verify_default(value)
+        self._default_result = self._precompute_default()
+
+    @staticmethod
+    def _check_nargs(nargs: int) -> int:
+        if not (nargs == 1 or nargs == -1):
+            raise DefinitionError(f"Require nargs == 1 or nargs == -1, got {nargs!r}.")
+        return nargs
+
+    def _precompute_default(self) -> Any:
+        if self.default is None:
+            return None
+        # Only pure conversions can be done once and reused by every parse.
+        if _is_pure(self.type):
+            return self.type(self.default)
+        return _UNSET
+
+    def _verify_default(self, value: Any) -> Any:
+        if value is None:
+            return None
+        if self.nargs != 1:
+            raise DefinitionError("For nargs == -1, the default value must be None.")
         try:
-            return self.type.safe_convert(value)
+            return _safe_convert(self.type, value)
         except TypeConversionError as e:
             raise DefinitionError(f"Invalid default value for argument {self.format_decl()}. {e}") from e
 
@@ -229,6 +326,25 @@ class Option:
             The help information.
     """
 
+    __slots__ = (
+        "dest",
+        "long_options",
+        "short_options",
+        "required",
+        "allow_multi",
+        "_type",
+        "_convert_str",
+        "_default",
+        "_default_result",
+        "hidden",
+        "show_default",
+        "metavar",
+        "help",
+    )
+
+    #: The option requires exactly one value.
+    nargs: ClassVar[int] = 1
+
     def __init__(
         self,
         *decls: str,
@@ -245,7 +361,7 @@ class Option:
         self.dest, self.long_options, self.short_options = self._parse(decls, dest=dest)
         self.required = required
         self.allow_multi = allow_multi
-        self.type = resolve_type(type or Str())
+        self.type = resolve_type(type) if type is not None else _DEFAULT_STR
         self.default = default
         self.hidden = hidden
         self.show_default = show_default
@@ -270,11 +386,11 @@ class Option:
         Availability: ``nargs == 1``.
         """
 
-        if not self.dest:
+        if not (dest := self.dest):
             return
 
-        result = self.type.convert_str(value)
-        args[self.dest] = result
+        result = self._convert_str(value)
+        args[dest] = result
 
     def store_const(self, args: dict[str, Any], *, key: str) -> None:
         """Store constant value to destination.
@@ -290,8 +406,7 @@ class Option:
         if not self.dest or self.dest in args:
             return
 
-        result = self.type(self.default) if self.default is not None else None
-        args[self.dest] = result
+        args[self.dest] = self._default_value()
 
     def format_decls(self) -> str:
         """Format declarations."""
@@ -311,14 +426,25 @@ class Option:
             return _norm_metavar(self.short_options[0][SHORT_PREFIX_LEN:])
 
     @property
-    def nargs(self) -> int:
-        """Return ``1``.
+    def keys(self) -> tuple[str, ...]:
+        # The keys of the option map, derived from the current declarations.
+        return (*self.long_options, *self.short_options)
 
-        Note:
-            The option requires exactly one value.
-        """
+    @property
+    def display_opts(self) -> str:
+        # Help information shows short options first.
+        return ", ".join(self.short_options + self.long_options)
+
+    @property
+    def type(self) -> Type:
+        return self._type
 
-        return 1
+    @type.setter
+    def type(self, value: Type) -> None:
+        self._type = value
+        # Bind the converter once for the parser to call on every value.
+        self._convert_str = value.convert_str
+        self._reset_results()
 
     @property
     def default(self) -> Any:
@@ -326,12 +452,33 @@ class Option:
 
     @default.setter
     def default(self, value: Any) -> None:
-        if value is not None:
-            try:
-                value = self.type.safe_convert(value)
-            except TypeConversionError as e:
-                raise DefinitionError(f"Invalid default value for option {self.format_decls()}. {e}") from e
-        self._default = value
+        self._default = self._verify_default(value)
+        self._default_result = self._precompute_default()
+
+    def _reset_results(self) -> None:
+        # The default is converted again on demand until it is reassigned.
+        self._default_result = _UNSET
+
+    def _default_value(self) -> Any:
+        if (result := self._default_result) is _UNSET:
+            result = self.type(self.default) if self.default is not None else None
+        return result
+
+    def _precompute_default(self) -> Any:
+        if self.default is None:
+            return None
+        # Only pure conversions can be done once and reused by every parse.
+        if _is_pure(self.type):
+            return self.type(self.default)
+        return _UNSET
+
+    def _verify_default(self, value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            return _safe_convert(self.type, value)
+        except TypeConversionError as e:
+            raise DefinitionError(f"Invalid default value for option {self.format_decls()}. {e}") from e
 
 
 class FlagOption(Option):
@@ -355,6 +502,11 @@ class FlagOption(Option):
             The help information.
     """
 
+    __slots__ = ("_const", "_const_result")
+
+    #: The flag option does not take a value.
+    nargs: ClassVar[int] = 0
+
     def __init__(
         self,
         *decls: str,
@@ -370,7 +522,7 @@ class FlagOption(Option):
             dest=dest,
             required=False,
             allow_multi=allow_multi,
-            type=Type(),
+            type=_DEFAULT_TYPE,
             default=default,
             hidden=hidden,
             show_default=False,
@@ -383,21 +535,10 @@ class FlagOption(Option):
         raise NotImplementedError
 
     def store_const(self, args: dict[str, Any], *, key: str) -> None:
-        if not self.dest:
+        if not (dest := self.dest):
             return
 
-        result = self.type(self.const) if self.const is not None else None
-        args[self.dest] = result
-
-    @property
-    def nargs(self) -> int:
-        """Return ``0``.
-
-        Note:
-            The flag option does not take a value.
-        """
-
-        return 0
+        args[dest] = self._const_value()
 
     @property
     def const(self) -> Any:
@@ -405,12 +546,27 @@ class FlagOption(Option):
 
     @const.setter
     def const(self, value: Any) -> None:
-        if value is not None:
-            try:
-                value = self.type.safe_convert(value)
-            except TypeConversionError as e:
-                raise DefinitionError(f"Invalid constant value for option {self.format_decls()}. {e}") from e
-        self._const = value
+        self._const = self._verify_const(value)
+        # The flag type is the plain Type, so the constant is converted only once.
+        self._const_result = self.type(self._const) if self._const is not None else None
+
+    def _reset_results(self) -> None:
+        super()._reset_results()
+        # The constant is converted again on demand until it is reassigned.
+        self._const_result = _UNSET
+
+    def _const_value(self) -> Any:
+        if (result := self._const_result) is _UNSET:
+            result = self.type(self.const) if self.const is not None else None
+        return result
+
+    def _verify_const(self, value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            return _safe_convert(self.type, value)
+        except TypeConversionError as e:
+            raise DefinitionError(f"Invalid constant value for option {self.format_decls()}. {e}") from e
 
 
 class OnOffOption(FlagOption):
@@ -438,6 +594,8 @@ class OnOffOption(FlagOption):
             The help information.
     """
 
+    __slots__ = ("on", "off", "default_flag")
+
     def __init__(
         self,
         on: str,
@@ -464,27 +622,20 @@ class OnOffOption(FlagOption):
         self.default_flag = default_flag
 
     def store_const(self, args: dict[str, Any], *, key: str) -> None:
-        if not self.dest:
+        if not (dest := self.dest):
             return
 
         result = self.on_value if key == self.on else self.off_value
-        args[self.dest] = result
+        args[dest] = result
 
     @property
     def on_value(self) -> Any:
-        if self.default_flag == "on":
-            result = self.type(self.default) if self.default is not None else None
-        else:
-            result = self.type(self.const) if self.const is not None else None
-        return result
+        # Reuse the default and constant already converted by the base classes.
+        return self._default_value() if self.default_flag == "on" else self._const_value()
 
     @property
     def off_value(self) -> Any:
-        if self.default_flag == "off":
-            result = self.type(self.default) if self.default is not None else None
-        else:
-            result = self.type(self.const) if self.const is not None else None
-        return result
+        return self._default_value() if self.default_flag == "off" else self._const_value()
 
 
 class AppendOption(Option):
@@ -507,6 +658,12 @@ class AppendOption(Option):
             The help information.
     """
 
+    __slots__ = ()
+
+    #: The append option allows multiple occurrences, and each occurrence
+    #: will append value to a list.
+    nargs: ClassVar[int] = 1
+
     def __init__(
         self,
         *decls: str,
@@ -530,11 +687,13 @@ class AppendOption(Option):
         )
 
     def store(self, args: dict[str, Any], value: str, *, key: str) -> None:
-        if not self.dest:
+        if not (dest := self.dest):
             return
 
-        result = self.type.convert_str(value)
-        cast(list, args.setdefault(self.dest, [])).append(result)
+        result = self._convert_str(value)
+        if (values := args.get(dest)) is None:
+            args[dest] = values = []
+        values.append(result)
 
     def store_default(self, args: dict[str, Any]) -> None:
         if not self.dest or self.dest in args:
@@ -542,17 +701,6 @@ class AppendOption(Option):
 
         args[self.dest] = []
 
-    @property
-    def nargs(self) -> int:
-        """Return ``1``.
-
-        Note:
-            The append option allows multiple occurrences, and each occurrence
-            will appen value to a list.
-        """
-
-        return 1
-
 
 class CountOption(Option):
     """The count option.
@@ -571,6 +719,12 @@ class CountOption(Option):
             The help information.
     """
 
+    __slots__ = ()
+
+    #: The count option allows multiple occurrences, and each occurrence
+    #: will increment a counter.
+    nargs: ClassVar[int] = 0
+
     def __init__(
         self, *decls: str, dest: str | None = None, default: int = 0, hidden: bool = False, help: str = ""
     ) -> None:
@@ -579,7 +733,7 @@ class CountOption(Option):
             dest=dest,
             required=False,
             allow_multi=True,
-            type=Int(),
+            type=_DEFAULT_INT,
             default=default,
             hidden=hidden,
             show_default=False,
@@ -591,21 +745,15 @@ class CountOption(Option):
         raise NotImplementedError
 
     def store_const(self, args: dict[str, Any], *, key: str) -> None:
-        if not self.dest:
+        if not (dest := self.dest):
             return
 
-        args[self.dest] = args.get(self.dest, 0) + 1
-
-    @property
-    def nargs(self) -> int:
-        """Return ``0``.
-
-        Note:
-            The count option allows multiple occurrences, and each occurrence
-            will increment a counter.
-        """
-
-        return 0
+        # The default is stored after parsing, so the first occurrence
+        # starts the counter.
+        try:
+            args[dest] += 1
+        except KeyError:
+            args[dest] = 1
 
 
 class SignalOption(Option):
@@ -620,13 +768,18 @@ class SignalOption(Option):
             The help information.
     """
 
+    __slots__ = ()
+
+    #: The signal option does not take a value.
+    nargs: ClassVar[int] = 0
+
     def __init__(self, *decls: str, hidden: bool = False, help: str = "") -> None:
         super().__init__(
             *decls,
             dest="",
             required=False,
             allow_multi=False,
-            type=Type(),
+            type=_DEFAULT_TYPE,
             default=None,
             hidden=hidden,
             show_default=False,
@@ -643,12 +796,6 @@ class SignalOption(Option):
     def store_default(self, args: dict[str, Any]) -> None:
         pass  # do nothing
 
-    @property
-    def nargs(self) -> int:
-        """Return ``0``."""
-
-        return 0
-
 
 class HelpOption(SignalOption):
     """The help option.
@@ -662,6 +809,8 @@ class HelpOption(SignalOption):
             The help information.
     """
 
+    __slots__ = ()
+
     def __init__(self, *decls: str, hidden: bool = False, help: str = "Show help information and exit.") -> None:
         super().__init__(*decls, hidden=hidden, help=help)
 
@@ -681,6 +830,8 @@ class VersionOption(SignalOption):
             The help information.
     """
 
+    __slots__ = ()
+
     def __init__(self, *decls: str, hidden: bool = False, help: str = "Show version information and exit.") -> None:
         super().__init__(*decls, hidden=hidden, help=help)
 
@@ -688,19 +839,41 @@ class VersionOption(SignalOption):
         raise VersionSignal
 
 
+# The kinds of command-line arguments.
+_POSITIONAL = 0
+_SHORT_OPTION = 1
+_LONG_OPTION = 2
+_SEPARATOR = 3
+
+
+def _classify_arg(arg: str) -> int:
+    # The parser classifies every token, so do it in one call.
+    if arg == SEPARATOR:
+        return _SEPARATOR
+    # Indexing yields cached single-character strings, which compare by
+    # identity without slicing.
+    if len(arg) > SHORT_PREFIX_LEN and arg[0] == SHORT_PREFIX:
+        # The long prefix is the short prefix doubled.
+        if len(arg) > LONG_PREFIX_LEN and arg[1] == SHORT_PREFIX:
+            return _LONG_OPTION
+        return _SHORT_OPTION
+    return _POSITIONAL
+
+
 def is_separator(arg: str) -> bool:
     """Determine whether the ``arg`` is a separator."""
 
-    return arg == SEPARATOR
+    return _classify_arg(arg) == _SEPARATOR
 
 
 def is_long_option(arg: str) -> bool:
     """Determine whether the ``arg`` is a long option."""
 
-    return arg.startswith(LONG_PREFIX) and len(arg) > LONG_PREFIX_LEN
+    return _classify_arg(arg) == _LONG_OPTION
 
 
 def is_short_option(arg: str) -> bool:
     """Determine whether the ``arg`` is a short option."""
 
-    return arg.startswith(SHORT_PREFIX) and len(arg) > SHORT_PREFIX_LEN
+    # Long options and the separator also start with the short prefix.
+    return _classify_arg(arg) != _POSITIONAL
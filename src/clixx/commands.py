@@ -3,9 +3,7 @@ from __future__ import annotations
 import sys
 from contextlib import suppress
 from importlib import import_module
-from typing import Any, Callable, Iterator, Optional, TypeVar, Union
-
-from typing_extensions import Self, TypeAlias
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TypeVar, Union
 
 from .constants import DEST_COMMAND_NAME
 from .exceptions import CommandError, ParserContextError
@@ -13,6 +11,9 @@ from .groups import ArgumentGroup, CommandGroup, OptionGroup
 from .parsers import Parser, SuperParser
 from .printers import PrinterFactory, PrinterHelper
 
+if TYPE_CHECKING:
+    from typing_extensions import Self, TypeAlias
+
 CommandFunction: TypeAlias = Callable[..., Optional[int]]
 SuperCommandFunction: TypeAlias = Callable[..., Optional["dict[str, Any]"]]
 
@@ -176,6 +177,22 @@ class Command(_Command):
     def function(self, value: CommandFunction) -> None:
         self._function = value
 
+    @property
+    def usage_metavars(self) -> list[str]:
+        """The argument metavars to display in usage, flattened from all
+        argument groups."""
+
+        metavars = []
+        for argument_group in self.argument_groups:
+            for argument in argument_group:
+                if metavar := argument.resolve_metavar():
+                    if not argument.required:
+                        metavar = "[" + metavar + "]"
+                    if argument.nargs == -1:
+                        metavar += "..."
+                    metavars.append(metavar)
+        return metavars
+
     def add_argument_group(self, group: ArgumentGroup) -> Self:
         self.argument_groups.append(group)
         return self
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import enum
-from typing import Final, Generic, Iterator, TypeVar
-
-from typing_extensions import Self, assert_never
+import sys
+from typing import TYPE_CHECKING, Final, Generic, Iterator, TypeVar
 
 from .arguments import Argument, Option
 from .exceptions import GroupError
 
+if sys.version_info >= (3, 11):
+    from typing import assert_never
+else:
+    from typing_extensions import assert_never
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 
 class GroupType(enum.Enum):
     """The group constraint type."""
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import weakref
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Callable, Generator, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from .arguments import Argument, Option, is_long_option, is_separator, is_short_option
+from .arguments import _LONG_OPTION, _SEPARATOR, _SHORT_OPTION, _classify_arg
 from .constants import DEST_COMMAND_NAME, SHORT_PREFIX_LEN
 from .exceptions import (
     InvalidArgument,
@@ -21,25 +20,16 @@ from .exceptions import (
 )
 
 if TYPE_CHECKING:
+    from .arguments import Argument, Option
     from .groups import ArgumentGroup, OptionGroup
 
 
-@contextmanager
-def _raise_invalid_argument_value(format_decl: Callable[[], str]) -> Generator[None, None, None]:
-    try:
-        yield
-    except TypeConversionError as e:
-        name = format_decl()
-        raise InvalidArgument(f"Invalid value for argument {name}. {e}") from e
+def _invalid_argument_value(name: str, e: TypeConversionError) -> InvalidArgument:
+    return InvalidArgument(f"Invalid value for argument {name}. {e}")
 
 
-@contextmanager
-def _raise_invalid_option_value(format_decls: Callable[[], str]) -> Generator[None, None, None]:
-    try:
-        yield
-    except TypeConversionError as e:
-        name = format_decls()
-        raise InvalidOptionValue(f"Invalid value for option {name}. {e}") from e
+def _invalid_option_value(name: str, e: TypeConversionError) -> InvalidOptionValue:
+    return InvalidOptionValue(f"Invalid value for option {name}. {e}")
 
 
 class ArgumentNode:
@@ -49,6 +39,8 @@ class ArgumentNode:
         self._argument = argument
         self.parent = cast(ArgumentGroupNode, weakref.proxy(parent))
         self.occurred = False
+        # The parser dispatches on nargs for every token, so read it once.
+        self.nargs = argument.nargs
 
     def _inc_occurred(self) -> None:
         if not self.occurred:
@@ -56,21 +48,21 @@ class ArgumentNode:
             self.parent.num_occurred += 1
 
     def store(self, args: dict[str, Any], value: str) -> None:
-        with _raise_invalid_argument_value(self.format_decl):
+        try:
             self._argument.store(args, value)
+        except TypeConversionError as e:
+            raise _invalid_argument_value(self.format_decl(), e) from e
         self._inc_occurred()
 
     def store_default(self, args: dict[str, Any]) -> None:
-        with _raise_invalid_argument_value(self.format_decl):
+        try:
             self._argument.store_default(args)
+        except TypeConversionError as e:
+            raise _invalid_argument_value(self.format_decl(), e) from e
 
     def format_decl(self) -> str:
         return self._argument.format_decl()
 
-    @property
-    def nargs(self) -> int:
-        return self._argument.nargs
-
     @property
     def required(self) -> bool:
         return self._argument.required
@@ -92,6 +84,8 @@ class OptionNode:
         self._option = option
         self.parent = cast(OptionGroupNode, weakref.proxy(parent))
         self.occurred = False
+        # The parser dispatches on nargs for every token, so read it once.
+        self.nargs = option.nargs
 
     def _inc_occurred(self, key: str) -> None:
         if not self.occurred:
@@ -102,26 +96,28 @@ class OptionNode:
                 raise MultiOption(f"Option {key!r} is not allowed to occur multiple times.")
 
     def store(self, args: dict[str, Any], value: str, *, key: str) -> None:
-        with _raise_invalid_option_value(lambda: repr(key)):
+        try:
             self._option.store(args, value, key=key)
+        except TypeConversionError as e:
+            raise _invalid_option_value(repr(key), e) from e
         self._inc_occurred(key)
 
     def store_const(self, args: dict[str, Any], *, key: str) -> None:
-        with _raise_invalid_option_value(self.format_decls):
+        try:
             self._option.store_const(args, key=key)
+        except TypeConversionError as e:
+            raise _invalid_option_value(self.format_decls(), e) from e
         self._inc_occurred(key)
 
     def store_default(self, args: dict[str, Any]) -> None:
-        with _raise_invalid_option_value(self.format_decls):
+        try:
             self._option.store_default(args)
+        except TypeConversionError as e:
+            raise _invalid_option_value(self.format_decls(), e) from e
 
     def format_decls(self) -> str:
         return self._option.format_decls()
 
-    @property
-    def nargs(self) -> int:
-        return self._option.nargs
-
     @property
     def required(self) -> bool:
         return self._option.required
@@ -230,11 +226,7 @@ class OptionParser:
             for option in group:
                 node = OptionNode(option, group_node)
                 group_node.children.append(node)
-                for key in option.long_options:
-                    if key in map:
-                        raise ParserContextError(f"Option {key!r} conflicts.")
-                    map[key] = node
-                for key in option.short_options:
+                for key in option.keys:
                     if key in map:
                         raise ParserContextError(f"Option {key!r} conflicts.")
                     map[key] = node
@@ -310,12 +302,12 @@ class Parser:
 
         switch_to_positional_only = False
         while (arg := ctx.next_arg) is not None:
-            if is_separator(arg):
+            if (kind := _classify_arg(arg)) == _SEPARATOR:
                 switch_to_positional_only = True
                 break
-            elif is_long_option(arg):
+            elif kind == _LONG_OPTION:
                 option_parser.parse_long_option(ctx, args, arg)
-            elif is_short_option(arg):
+            elif kind == _SHORT_OPTION:
                 option_parser.parse_short_option(ctx, args, arg)
             else:
                 argument_parser.parse_argument(ctx, args, arg)
@@ -341,12 +333,12 @@ class SuperParser:
 
         switch_to_positional_only = False
         while (arg := ctx.next_arg) is not None:
-            if is_separator(arg):
+            if (kind := _classify_arg(arg)) == _SEPARATOR:
                 switch_to_positional_only = True
                 break
-            elif is_long_option(arg):
+            elif kind == _LONG_OPTION:
                 option_parser.parse_long_option(ctx, args, arg)
-            elif is_short_option(arg):
+            elif kind == _SHORT_OPTION:
                 option_parser.parse_short_option(ctx, args, arg)
             else:
                 self._store_command(ctx, args, arg)
@@ -8,12 +8,13 @@ import pathlib
 import stat
 import sys
 from contextlib import suppress
-from typing import IO, Any, Callable, Generic, Sequence, TypeVar, Union, cast
-
-from typing_extensions import Never
+from typing import IO, TYPE_CHECKING, Any, Callable, Generic, Sequence, TypeVar, Union, cast
 
 from .exceptions import DefinitionError, TypeConversionError
 
+if TYPE_CHECKING:
+    from typing_extensions import Never
+
 
 def _force_decode(filename: Any) -> str:
     fname = cast(Union[str, bytes], os.fspath(filename))
@@ -701,6 +702,34 @@ class FilePath(Path):
         return "FILE"
 
 
+# The builtin type converters whose conversion has no side effect and does not
+# depend on the environment. Subclasses are excluded since they may override it.
+_PURE_TYPES: frozenset[type[Type]] = frozenset(
+    {Type, Str, Bool, Int, Float, IntRange, FloatRange, Choice, IntChoice, Enum, IntEnum, DateTime}
+)
+
+
+def _is_pure(type: Type) -> bool:
+    return type.__class__ in _PURE_TYPES
+
+
+# The builtin type converters and the values they return unchanged.
+_NATIVE_TYPES: dict[type[Type], type] = {Str: str, Bool: bool, Int: int, Float: float}
+
+
+def _is_native(type: Type, value: Any) -> bool:
+    cls = type.__class__
+    return cls is Type or _NATIVE_TYPES.get(cls) is value.__class__
+
+
+# The converters resolved from Python's builtin types. They hold no state, so
+# one instance of each is shared.
+_STR = Str()
+_BOOL = Bool()
+_INT = Int()
+_FLOAT = Float()
+
+
 def resolve_type(type: Type | type) -> Type:
     """Convert Python's builtin type to CLIXX's type. Return as is if ``type``
     is already an instance of :class:`clixx.types.Type`.
@@ -721,11 +750,11 @@ def resolve_type(type: Type | type) -> Type:
     if isinstance(type, Type):
         return type
     if type is str:
-        return Str()
+        return _STR
     if type is bool:
-        return Bool()
+        return _BOOL
     if type is int:
-        return Int()
+        return _INT
     if type is float:
-        return Float()
+        return _FLOAT
     raise DefinitionError(f"{type!r} is not a valid type.")
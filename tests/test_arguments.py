@@ -0,0 +1,184 @@
+import itertools
+import re
+
+import pytest
+
+import clixx
+from clixx.arguments import _LONG_OPTION, _POSITIONAL, _SEPARATOR, _SHORT_OPTION, OnOffOption, _classify_arg
+from clixx.parsers import OptionParser
+
+
+@pytest.mark.parametrize(
+    ("decl", "message"),
+    [
+        ("", "Option must be non-empty."),
+        ("x", "Option must start with '--' or '-', got 'x'."),
+        ("--", "'--' is not a valid long option."),
+        ("--a", "Long option '--a' is too short."),
+        ("-", "'-' is not a valid short option."),
+        ("-ab", "Short option '-ab' is too long."),
+        ("--a<b", "Option '--a<b' contains reserved character '<'."),
+        ("-<", "Option '-<' contains reserved character '<'."),
+    ],
+)
+def test_invalid_option_decl(decl: str, message: str) -> None:
+    with pytest.raises(clixx.DefinitionError, match=f"^{re.escape(message)}$"):
+        clixx.Option(decl)
+
+
+def test_no_option_decl() -> None:
+    with pytest.raises(clixx.DefinitionError, match=r"^No option defined\.$"):
+        clixx.Option()
+
+
+def test_classify_arg() -> None:
+    assert _classify_arg("--") == _SEPARATOR
+    assert _classify_arg("--ab") == _LONG_OPTION
+    assert _classify_arg("-a") == _SHORT_OPTION
+    assert _classify_arg("-ab") == _SHORT_OPTION
+    assert _classify_arg("-") == _POSITIONAL
+    assert _classify_arg("a") == _POSITIONAL
+    assert _classify_arg("") == _POSITIONAL
+
+    for n in range(6):
+        for chars in itertools.product("-a<", repeat=n):
+            arg = "".join(chars)
+            kind = _classify_arg(arg)
+            assert clixx.is_separator(arg) == (arg == "--") == (kind == _SEPARATOR)
+            assert clixx.is_long_option(arg) == (arg.startswith("--") and len(arg) > 2) == (kind == _LONG_OPTION)
+            assert clixx.is_short_option(arg) == (arg.startswith("-") and len(arg) > 1) == (kind != _POSITIONAL)
+
+
+def test_argument_setters() -> None:
+    argument = clixx.Argument("x", type=clixx.Int(), default=1)
+
+    with pytest.raises(clixx.DefinitionError, match=r"^Require nargs == 1 or nargs == -1, got 5\.$"):
+        argument.nargs = 5
+    with pytest.raises(clixx.DefinitionError, match=r"^Invalid default value for argument 'x'\."):
+        argument.default = "a"
+    assert argument.nargs == 1
+    assert argument.default == 1
+
+    argument.default = "2"
+    assert argument.default == 2
+    args: dict = {}
+    argument.store_default(args)
+    assert args == {"x": 2}
+
+    argument.type = clixx.Str()
+    args = {}
+    argument.store(args, "3")
+    assert args == {"x": "3"}
+
+
+def test_type_setter_with_none_default() -> None:
+    argument = clixx.Argument("num")
+    argument.type = clixx.Int()
+    args: dict = {}
+    argument.store_default(args)
+    assert args == {"num": None}
+
+    option = clixx.Option("--xx")
+    option.type = clixx.Int()
+    args = {}
+    option.store_default(args)
+    assert args == {"xx": None}
+
+    on_off = OnOffOption("--on", "--off", dest="x", off_value=None)
+    on_off.type = clixx.Int()
+    assert on_off.off_value is None
+
+
+def test_option_setters() -> None:
+    option = clixx.Option("--num", type=clixx.Int())
+
+    with pytest.raises(clixx.DefinitionError, match=r"^Invalid default value for option '--num'\."):
+        option.default = "a"
+
+    option.default = "2"
+    args: dict = {}
+    option.store_default(args)
+    assert args == {"num": 2}
+
+    option.metavar = "N"
+    assert option.resolve_metavar() == "N"
+    option.metavar = None
+    assert option.resolve_metavar() == "INTEGER"
+
+
+def test_resolve_metavar_follows_type() -> None:
+    option = clixx.Option("--num")
+    assert option.resolve_metavar() == "NUM"
+    option.type = clixx.Int()
+    assert option.resolve_metavar() == "INTEGER"
+
+    choice = clixx.Choice(["a", "b"])
+    option.type = choice
+    assert option.resolve_metavar() == "[a|b]"
+    choice.choices.append("c")
+    assert option.resolve_metavar() == "[a|b|c]"
+
+
+def test_option_keys() -> None:
+    option = clixx.Option("--foo", "-f")
+    assert option.keys == ("--foo", "-f")
+
+    option.long_options.append("--bar")
+    assert option.keys == ("--foo", "--bar", "-f")
+
+    group = clixx.OptionGroup("Options")
+    group.add(option)
+    parser = OptionParser([group])
+    assert parser.option_map.keys() == {"--foo", "--bar", "-f"}
+
+
+def test_format_decls() -> None:
+    argument = clixx.Argument("src")
+    argument.argument = "dst"
+    assert argument.format_decl() == "'dst'"
+
+    option = clixx.Option("--foo")
+    assert option.format_decls() == "'--foo'"
+    assert option.display_opts == "--foo"
+
+    option.short_options.append("-f")
+    assert option.format_decls() == "'-f' / '--foo'"
+    assert option.display_opts == "-f, --foo"
+
+
+def test_flag_option_setters() -> None:
+    option = clixx.FlagOption("--flag")
+
+    option.const = "on"
+    args: dict = {}
+    option.store_const(args, key="--flag")
+    assert args == {"flag": "on"}
+
+
+def test_flag_option_type_setter() -> None:
+    option = clixx.FlagOption("--flag", const="yes")
+    option.type = clixx.Bool()
+    args: dict = {}
+    option.store_const(args, key="--flag")
+    assert args == {"flag": True}
+
+    on_off = OnOffOption("--on", "--off", dest="x", on_value="yes")
+    on_off.type = clixx.Bool()
+    assert on_off.on_value is True
+
+
+def test_on_off_option_setters() -> None:
+    option = OnOffOption("--on", "--off", dest="x")
+    assert option.on_value is True
+    assert option.off_value is False
+
+    option.const = "yes"
+    option.default = "no"
+    assert option.on_value == "yes"
+    assert option.off_value == "no"
+
+    args: dict = {}
+    option.store_const(args, key="on")
+    assert args == {"x": "yes"}
+    option.store_const(args, key="off")
+    assert args == {"x": "no"}
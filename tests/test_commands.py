@@ -0,0 +1,27 @@
+import clixx
+
+
+def test_usage_metavars() -> None:
+    cmd = clixx.Command("test")
+    group = clixx.ArgumentGroup("Arguments")
+    cmd.add_argument_group(group)
+    group.add(clixx.Argument("src", required=True))
+    assert cmd.usage_metavars == ["SRC"]
+
+    group.add(clixx.Argument("dst", nargs=-1))
+    assert cmd.usage_metavars == ["SRC", "[DST]..."]
+
+
+def test_get_cmd_path() -> None:
+    paths = []
+    cmd = clixx.Command("test", pass_cmd=True)
+    cmd.function = lambda cmd: paths.append(cmd.get_cmd_path())
+
+    cmd(argv=[], prog="first", standalone=False)
+    cmd(argv=[], prog="second", standalone=False)
+    assert paths == ["first", "second"]
+
+    parent = clixx.SuperCommand("parent")
+    parent.prog = "parent"
+    cmd.parent = parent
+    assert cmd.get_cmd_path() == "parent second"
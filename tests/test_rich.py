@@ -0,0 +1,25 @@
+import pytest
+
+import clixx
+from clixx._rich import RichPrinter
+
+
+def test_print_error(capsys: pytest.CaptureFixture[str]) -> None:
+    cmd = clixx.Command("test")
+    group = clixx.ArgumentGroup("Arguments")
+    cmd.add_argument_group(group)
+    group.add(clixx.Argument("src", required=True))
+    group.add(clixx.Argument("dst", nargs=-1))
+    cmd.prog = "[bold]test[/bold]"
+
+    # Piped output is neither wrapped nor styled, and markup is left as is.
+    message = "Got [red]" + "x" * 200 + "[/red]."
+    RichPrinter({}).print_error(cmd, clixx.InvalidArgument(message))
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err == (
+        "Usage: [bold]test[/bold] SRC [DST]...\n"
+        "Try '[bold]test[/bold] --help' for help.\n"
+        "\n"
+        f"Error: {message}\n"
+    )